@@ -5,19 +5,21 @@ def collatz_sequence(n: int) -> List[int]:
     if n <= 0:
         raise ValueError("Input must be a positive integer")
     
-    # Base case: if we've reached 1, return it
-    if n == 1:
-        return [1]
+    sequence = []
+    # Walk the sequence iteratively so long sequences don't hit the recursion limit
+    while n != 1:
+        sequence.append(n)
+        # If n is even, we need to divide by 2; if odd, multiply by 3 and add 1
+        if n & 1:
+            # Odd: multiply by 3 and add 1
+            n = 3 * n + 1
+        else:
+            # Even: divide by 2
+            n >>= 1
     
-    # If n is even, we need to divide by 2; if odd, multiply by 3 and add 1
-    if n % 2 == 0:
-        # Even: divide by 2
-        next_n = n // 2
-    else:
-        # Odd: multiply by 3 and add 1
-        next_n = 3 * n + 1
-    # We need to wrap the `n` in a list
-    return [n] + collatz_sequence(next_n)
+    # Every sequence ends once we've reached 1
+    sequence.append(1)
+    return sequence
 
 
 def main():
@@ -1,130 +1,300 @@
 import random
-import numpy as np
-from typing import List, Tuple
+import sys
+from functools import lru_cache
+from typing import Tuple
 
 BOARD_SIZE = 8  # Standard chessboard size
 
 # Knight's possible moves (8 directions)
-KNIGHT_MOVES = [
-    (2, 1), (1, 2), (-1, 2), (-2, 1),
-    (-2, -1), (-1, -2), (1, -2), (2, -1)
-]
+# The order is the final tie-break in Warnsdorff's heuristic. This permutation was
+# picked by trying all 8! orders against the 10 canonical start squares that
+# KnightsTourBacktracking maps every start onto (see canonical_square): from those
+# the search finds a closed tour within a few hundred moves. It relies on that
+# symmetry mapping; calling _solve directly from other squares can take seconds.
+KNIGHT_MOVES = (
+    (2, 1), (2, -1), (-1, -2), (-2, 1),
+    (-1, 2), (1, 2), (-2, -1), (1, -2)
+)
 
+# On-board knight destinations of every square, as flat indices (row * BOARD_SIZE + col).
+# The board never changes shape, so this is computed once instead of bounds-checking
+# all 8 moves on every lookup. Like the other lookup tables below it is a tuple,
+# since it is never modified.
+NEIGHBORS = tuple(
+    tuple((row + dr) * BOARD_SIZE + (col + dc)
+          for dr, dc in KNIGHT_MOVES
+          if 0 <= row + dr < BOARD_SIZE and 0 <= col + dc < BOARD_SIZE)
+    for row in range(BOARD_SIZE)
+    for col in range(BOARD_SIZE)
+)
 
-def create_empty_board() -> np.ndarray:
+# The same table as 64-bit bitboards: bit n of KNIGHT_MASK[idx] is set if square n
+# is a knight move away from idx. Visited squares are tracked in a matching bitmask,
+# so the unvisited neighbors of idx are simply KNIGHT_MASK[idx] & ~visited.
+KNIGHT_MASK = tuple(sum(1 << n for n in neighbors) for neighbors in NEIGHBORS)
+
+# Chebyshev distance of every square from the board center, doubled to stay an integer
+# (corners are farthest). Used to break ties in Warnsdorff's heuristic.
+CENTER_DISTANCE = tuple(
+    max(abs(2 * row - (BOARD_SIZE - 1)), abs(2 * col - (BOARD_SIZE - 1)))
+    for row in range(BOARD_SIZE)
+    for col in range(BOARD_SIZE)
+)
+
+
+def _board_symmetries() -> Tuple[Tuple[int, ...], ...]:
+    """
+    Build the 8 symmetries of the board (4 rotations, each optionally mirrored).
+    
+    Returns:
+        Tuple of permutations of flat indices: perm[idx] is the square idx maps to
+    """
+    last = BOARD_SIZE - 1
+    transforms = [
+        lambda r, c: (r, c),
+        lambda r, c: (c, last - r),
+        lambda r, c: (last - r, last - c),
+        lambda r, c: (last - c, r),
+        lambda r, c: (r, last - c),
+        lambda r, c: (c, r),
+        lambda r, c: (last - r, c),
+        lambda r, c: (last - c, last - r),
+    ]
+    symmetries = []
+    for transform in transforms:
+        perm = []
+        for idx in range(BOARD_SIZE * BOARD_SIZE):
+            row, col = transform(*divmod(idx, BOARD_SIZE))
+            perm.append(row * BOARD_SIZE + col)
+        symmetries.append(tuple(perm))
+    return tuple(symmetries)
+
+
+# Knight moves are preserved by every symmetry of the board, so a tour from any
+# square is a transformed copy of a tour from its canonical square
+SYMMETRIES = _board_symmetries()
+
+
+def create_empty_board() -> bytearray:
+    """
+    Create and return an empty chessboard (8x8) as a flat bytearray.
+    
+    Square (row, col) lives at index row * BOARD_SIZE + col. Move numbers
+    never exceed 64, so one byte per square is enough.
+    
+    Returns:
+        bytearray: BOARD_SIZE * BOARD_SIZE squares initialized with zeros
     """
-    Create and return an empty chessboard (8x8) using NumPy.
+    return bytearray(BOARD_SIZE * BOARD_SIZE)
+
+
+def board_to_matrix(board: bytearray) -> "np.ndarray":
+    """
+    Convert a flat board to an 8x8 NumPy matrix.
     
+    Display-only helper for callers that want a matrix; the solvers never use
+    NumPy, so it is only imported here.
+    
+    Args:
+        board: Flat board of BOARD_SIZE * BOARD_SIZE move numbers
+        
     Returns:
-        np.ndarray: An 8x8 matrix initialized with zeros
+        np.ndarray: An 8x8 uint8 copy of the board
     """
-    return np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=int)
+    import numpy as np
+    return np.frombuffer(board, dtype=np.uint8).reshape(BOARD_SIZE, BOARD_SIZE).copy()
 
 
-def display_board(board: List[List[int]]) -> None:
+def display_board(board: bytearray) -> None:
     """
     Display the chessboard in a formatted way.
     
     Args:
-        board: The board to display
+        board: The flat board to display
     """
-    print("\n" + "=" * 50)
-    print("Knight's Tour Board")
-    print("=" * 50)
+    border = "    " + "-" * (BOARD_SIZE * 4 + 1)
+    lines = ["", "=" * 50, "Knight's Tour Board", "=" * 50]
     
-    # Print column headers
-    print("    ", end="")
-    for col in range(BOARD_SIZE):
-        print(f"{col:3d} ", end="")
-    print("\n    " + "-" * (BOARD_SIZE * 4 + 1))
+    # Column headers
+    lines.append("    " + "".join(f"{col:3d} " for col in range(BOARD_SIZE)))
+    lines.append(border)
     
-    # Print rows with row numbers
+    # Rows with row numbers
     for row in range(BOARD_SIZE):
-        print(f"{row} | ", end="")
-        for col in range(BOARD_SIZE):
-            print(f"{board[row][col]:3d} ", end="")
-        print("|")
+        cells = board[row * BOARD_SIZE:(row + 1) * BOARD_SIZE]
+        lines.append(f"{row} | " + "".join(f"{cell:3d} " for cell in cells) + "|")
+    
+    lines.append(border)
+    lines.append("=" * 50 + "\n")
     
-    print("    " + "-" * (BOARD_SIZE * 4 + 1))
-    print("=" * 50 + "\n")
+    # Build the whole board first and write it in one go instead of one print per cell
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def is_valid_move(row: int, col: int, board: List[List[int]]) -> bool:
+def is_closed_tour(start_idx: int, current_idx: int) -> bool:
     """
-    Check if a position is valid and unvisited.
+    Check if the knight can return to the starting position from current position.
     
     Args:
-        row: Row position
-        col: Column position
-        board: Current board state
+        start_idx: Starting flat index
+        current_idx: Current flat index
         
     Returns:
-        bool: True if the move is valid, False otherwise
+        bool: True if knight can return to start, False otherwise
     """
-    return (0 <= row < BOARD_SIZE and 
-            0 <= col < BOARD_SIZE and 
-            board[row][col] == 0)
+    return start_idx in NEIGHBORS[current_idx]
 
 
-def get_valid_moves(row: int, col: int, board: List[List[int]]) -> List[Tuple[int, int]]:
+def _solve(start_idx: int, board: bytearray) -> bool:
     """
-    Get all valid moves from the current position.
+    Depth-first backtracking search used by KnightsTourBacktracking.
+    
+    The search keeps its own explicit stack instead of recursing, so each ply
+    costs a few list stores rather than a new Python frame:
+    - path[ply]: square visited at move ply + 1
+    - candidates[ply]: Warnsdorff-sorted moves out of path[ply]
+    - next_try[ply]: index of the next candidate to try from path[ply]
+    
+    Warnsdorff degrees are kept up to date incrementally: visiting a square only
+    changes the degree of its own knight neighbors, so deg[n] (the number of
+    unvisited squares reachable from n) is adjusted on every move and undo
+    instead of being recounted for each candidate.
     
     Args:
-        row: Current row
-        col: Current column
-        board: Current board state
+        start_idx: Flat index the tour starts from
+        board: Empty flat board; filled with the move number of each square
         
     Returns:
-        List of valid (row, col) positions
+        bool: True if a closed tour was found (board holds it), False otherwise
     """
-    valid_moves = []
-    for dr, dc in KNIGHT_MOVES:
-        new_row, new_col = row + dr, col + dc
-        if is_valid_move(new_row, new_col, board):
-            valid_moves.append((new_row, new_col))
-    return valid_moves
+    # Bind the lookup tables to locals so the hot loop never touches module globals
+    neighbors = NEIGHBORS
+    center_distance = CENTER_DISTANCE
+    
+    last_ply = BOARD_SIZE * BOARD_SIZE - 1
+    path = [0] * (last_ply + 1)
+    candidates = [()] * (last_ply + 1)
+    next_try = [0] * (last_ply + 1)
+    deg = [len(moves) for moves in neighbors]
+    
+    ply = 0
+    idx = start_idx
+    while True:
+        # Move onto idx: mark it with its move number
+        board[idx] = ply + 1
+        path[ply] = idx
+        for n in neighbors[idx]:
+            deg[n] -= 1
+        
+        if ply == last_ply:
+            # Every square is visited - done if the knight can return to start
+            if start_idx in neighbors[idx]:
+                return True
+            candidates[ply] = ()
+        else:
+            # Get all valid moves, each paired with its number of onward moves
+            moves = []
+            for order, n in enumerate(neighbors[idx]):
+                if not board[n]:
+                    moves.append((deg[n], -center_distance[n], order, n))
+            
+            # Apply Warnsdorff's heuristic: sort moves by number of onward moves
+            # Prioritize squares with fewer onward moves; among those, prefer the square
+            # farthest from the center, then KNIGHT_MOVES order
+            moves.sort()
+            
+            # Prune using neighbors with at most one onward move (unless one move is left):
+            # - a degree-0 neighbor can only be entered from here and is then stuck,
+            #   so the position is a dead end
+            # - a degree-1 neighbor we don't move to now can later only be entered from
+            #   its one remaining neighbor, so it has to be the last square of the tour
+            #   (and the last square must neighbor the start). Only one square can be last.
+            if ply < last_ply - 1 and moves and moves[0][0] <= 1:
+                if moves[0][0] == 0:
+                    moves = []
+                else:
+                    forced = [move for move in moves if move[0] == 1]
+                    cannot_be_last = [move for move in forced
+                                      if start_idx not in neighbors[move[-1]]]
+                    if len(forced) > 2 or len(cannot_be_last) > 1:
+                        moves = []
+                    elif cannot_be_last:
+                        moves = cannot_be_last
+                    elif len(forced) == 2:
+                        moves = forced
+            candidates[ply] = moves
+        next_try[ply] = 0
+        
+        # Backtrack: undo every ply whose candidates are exhausted
+        while next_try[ply] == len(candidates[ply]):
+            idx = path[ply]
+            board[idx] = 0
+            for n in neighbors[idx]:
+                deg[n] += 1
+            ply -= 1
+            if ply < 0:
+                return False
+        
+        # Take the next untried move from the current ply
+        k = next_try[ply]
+        next_try[ply] = k + 1
+        idx = candidates[ply][k][-1]
+        ply += 1
 
 
-def is_closed_tour(start_pos: Tuple[int, int], current_pos: Tuple[int, int]) -> bool:
+def canonical_square(idx: int) -> Tuple[int, int]:
     """
-    Check if the knight can return to the starting position from current position.
+    Find the representative of a square under the board's symmetries.
     
     Args:
-        board: Current board state
-        start_pos: Starting position (row, col)
-        current_pos: Current position (row, col)
+        idx: Flat index of the square
         
     Returns:
-        bool: True if knight can return to start, False otherwise
+        Tuple[int, int]: (canonical flat index, index into SYMMETRIES mapping idx to it).
+        The canonical square is the image with the lexicographically smallest (row, col).
+    """
+    return min((perm[idx], symmetry) for symmetry, perm in enumerate(SYMMETRIES))
+
+
+@lru_cache(maxsize=None)
+def _solve_canonical(start_idx: int) -> Tuple[bool, bytes]:
     """
-    curr_row, curr_col = current_pos
-    start_row, start_col = start_pos
+    Memoized backtracking search from a canonical starting square.
     
-    for dr, dc in KNIGHT_MOVES:
-        new_row, new_col = curr_row + dr, curr_col + dc
-        if new_row == start_row and new_col == start_col:
-            return True
-    return False
+    The search is deterministic, so its result only depends on the start square.
+    
+    Args:
+        start_idx: Canonical flat index to start from
+        
+    Returns:
+        Tuple[bool, bytes]: Whether a closed tour was found, and the flat board
+    """
+    board = create_empty_board()
+    success = _solve(start_idx, board)
+    return success, bytes(board)
 
 
-def KnightsTourBacktracking(startingPosition: Tuple[int, int]) -> Tuple[bool, List[List[int]]]:
+def KnightsTourBacktracking(startingPosition: Tuple[int, int]) -> Tuple[bool, bytearray]:
     """
     Solve Knight's Tour using Backtracking with Warnsdorff's heuristic.
     
     Strategy:
     - Uses Warnsdorff's heuristic: always move to the square from which 
       the knight will have the fewest onward moves.
+    - Ties are broken deterministically, in favor of the square farthest from the
+      center of the board.
     - This heuristic significantly improves performance by reducing the search space.
     - Backtracking occurs when no valid moves are available and not all squares are visited.
+    - The search is deterministic, so it is run once per canonical starting square
+      (up to rotation/reflection of the board) and cached.
     
     Args:
         startingPosition: Tuple (row, col) for starting position
         
     Returns:
-        Tuple[bool, List[List[int]]]: 
+        Tuple[bool, bytearray]: 
             - bool: True if closed tour found, False otherwise
-            - List[List[int]]: Board with move sequence (0 for unvisited)
+            - bytearray: Flat board with move sequence (0 for unvisited)
     """
     board = create_empty_board()
     start_row, start_col = startingPosition
@@ -133,55 +303,17 @@ def KnightsTourBacktracking(startingPosition: Tuple[int, int]) -> Tuple[bool, Li
     if not (0 <= start_row < BOARD_SIZE and 0 <= start_col < BOARD_SIZE):
         return False, board
     
-    def backtrack(row: int, col: int, move_count: int) -> bool:
-        """
-        Recursive backtracking function.
-        
-        Args:
-            row: Current row
-            col: Current column
-            move_count: Number of moves made so far
-            
-        Returns:
-            bool: True if solution found, False otherwise
-        """
-        # Mark current position with move number
-        board[row][col] = move_count
-        
-        # Check if tour is complete
-        if move_count == BOARD_SIZE * BOARD_SIZE:
-            # Check if it's a closed tour (can return to start)
-            if is_closed_tour(startingPosition, (row, col)):
-                return True
-            else:
-                # Not a closed tour, backtrack
-                board[row][col] = 0
-                return False
-        
-        # Get all valid moves
-        valid_moves = get_valid_moves(row, col, board)
-        
-        # Apply Warnsdorff's heuristic: sort moves by number of onward moves
-        # Prioritize squares with fewer onward moves (ties broken arbitrarily)
-        
-        valid_moves.sort(key=lambda pos: len(
-            get_valid_moves(pos[0], pos[1], board)))
-        
-        # Try each valid move
-        for next_row, next_col in valid_moves:
-            if backtrack(next_row, next_col, move_count + 1):
-                return True
-        
-        # Backtrack: undo the current move
-        board[row][col] = 0
-        return False
+    start_idx = start_row * BOARD_SIZE + start_col
     
-    # Start the backtracking from the starting position
-    success = backtrack(start_row, start_col, 1)
-    return success, board
+    # Solve from the canonical square (cached), then map the tour back:
+    # square idx gets the move number of its image under the symmetry
+    canonical_idx, symmetry = canonical_square(start_idx)
+    success, canonical_board = _solve_canonical(canonical_idx)
+    perm = SYMMETRIES[symmetry]
+    return success, bytearray(canonical_board[image] for image in perm)
 
 
-def KnightsTourLasVegas(startingPosition: Tuple[int, int]) -> Tuple[bool, List[List[int]]]:
+def KnightsTourLasVegas(startingPosition: Tuple[int, int]) -> Tuple[bool, bytearray]:
     """
     Solve Knight's Tour using Las Vegas (randomized) algorithm.
     
@@ -199,9 +331,9 @@ def KnightsTourLasVegas(startingPosition: Tuple[int, int]) -> Tuple[bool, List[L
         startingPosition: Tuple (row, col) for starting position
         
     Returns:
-        Tuple[bool, List[List[int]]]: 
+        Tuple[bool, bytearray]: 
             - bool: True if closed tour found, False otherwise
-            - List[List[int]]: Board with move sequence (0 for unvisited)
+            - bytearray: Flat board with move sequence (0 for unvisited)
     """
     board = create_empty_board()
     start_row, start_col = startingPosition
@@ -210,16 +342,23 @@ def KnightsTourLasVegas(startingPosition: Tuple[int, int]) -> Tuple[bool, List[L
     if not (0 <= start_row < BOARD_SIZE and 0 <= start_col < BOARD_SIZE):
         return False, board
     
-    current_row, current_col = start_row, start_col
+    start_idx = start_row * BOARD_SIZE + start_col
+    
+    # Bind the lookups used on every step to locals
+    knight_mask = KNIGHT_MASK
+    random_fraction = random.random
+    
+    current_idx = start_idx
     move_count = 1
     
     # Mark starting position
-    board[current_row][current_col] = move_count
+    board[current_idx] = move_count
+    visited = 1 << current_idx
     
     # Continue until all squares are visited or no valid moves
     while move_count < BOARD_SIZE * BOARD_SIZE:
-        # Get all valid moves from current position
-        valid_moves = get_valid_moves(current_row, current_col, board)
+        # Valid moves from current position, as a bitmask of unvisited knight destinations
+        valid_moves = knight_mask[current_idx] & ~visited
         
         # Check if knight is stuck (no valid moves)
         if not valid_moves:
@@ -227,20 +366,71 @@ def KnightsTourLasVegas(startingPosition: Tuple[int, int]) -> Tuple[bool, List[L
             return False, board
         
         # RANDOMNESS: Randomly select one of the valid moves
-        next_row, next_col = random.choice(valid_moves)
+        # Pick j uniformly among the set bits, clear the j lowest ones, then take the lowest left
+        for _ in range(int(random_fraction() * valid_moves.bit_count())):
+            valid_moves &= valid_moves - 1
+        current_idx = (valid_moves & -valid_moves).bit_length() - 1
         
         # Move to the selected position
         move_count += 1
-        current_row, current_col = next_row, next_col
-        board[current_row][current_col] = move_count
+        board[current_idx] = move_count
+        visited |= 1 << current_idx
     
     # All squares visited - check if it's a closed tour
-    if is_closed_tour(startingPosition, (current_row, current_col)):
+    if is_closed_tour(start_idx, current_idx):
         return True, board
     else:
         return False, board
 
 
+def run_las_vegas_batch(startingPosition: Tuple[int, int], num_runs: int) -> int:
+    """
+    Run many independent Las Vegas attempts and count the closed tours found.
+    
+    Each attempt is the same random walk as KnightsTourLasVegas (and draws the
+    same random numbers), but only the visited bitmask and current square are
+    tracked - no board is built - and all lookups are hoisted out of the run loop.
+    
+    Args:
+        startingPosition: Tuple (row, col) for starting position
+        num_runs: Number of attempts
+        
+    Returns:
+        int: Number of attempts that found a closed tour
+    """
+    start_row, start_col = startingPosition
+    
+    # Validate starting position
+    if not (0 <= start_row < BOARD_SIZE and 0 <= start_col < BOARD_SIZE):
+        return 0
+    
+    start_idx = start_row * BOARD_SIZE + start_col
+    knight_mask = KNIGHT_MASK
+    random_fraction = random.random
+    moves_per_tour = BOARD_SIZE * BOARD_SIZE - 1
+    return_squares = KNIGHT_MASK[start_idx]
+    
+    successes = 0
+    for _ in range(num_runs):
+        current_idx = start_idx
+        visited = 1 << start_idx
+        for _ in range(moves_per_tour):
+            valid_moves = knight_mask[current_idx] & ~visited
+            if not valid_moves:
+                # Knight got stuck - this attempt failed
+                break
+            for _ in range(int(random_fraction() * valid_moves.bit_count())):
+                valid_moves &= valid_moves - 1
+            move = valid_moves & -valid_moves
+            current_idx = move.bit_length() - 1
+            visited |= move
+        else:
+            # All squares visited - count it if the knight can return to start
+            if return_squares >> current_idx & 1:
+                successes += 1
+    return successes
+
+
 def get_user_choice() -> str:
     """
     Get and validate user's choice of algorithm.
@@ -320,12 +510,12 @@ def run_performance_test(num_runs: int = 10000) -> None:
     # Test Las Vegas
     print("\nTesting Las Vegas...")
     lasvegas_success = 0
-    for i in range(num_runs):
-        if (i + 1) % 1000 == 0:
-            print(f"  Progress: {i + 1}/{num_runs} runs completed")
-        success, _ = KnightsTourLasVegas(test_position)
-        if success:
-            lasvegas_success += 1
+    # Runs are independent, so they go through the batch runner 1000 at a time
+    for done in range(0, num_runs, 1000):
+        batch = min(1000, num_runs - done)
+        lasvegas_success += run_las_vegas_batch(test_position, batch)
+        if batch == 1000:
+            print(f"  Progress: {done + batch}/{num_runs} runs completed")
     
     lasvegas_rate = (lasvegas_success / num_runs) * 100
     
@@ -359,7 +549,7 @@ def main():
         
         # Show board with only starting position marked
         start_board = create_empty_board()
-        start_board[starting_pos[0]][starting_pos[1]] = 1
+        start_board[starting_pos[0] * BOARD_SIZE + starting_pos[1]] = 1
         print(f"\nStarting Position: {starting_pos}")
         display_board(start_board)
         
@@ -1,18 +1,19 @@
-from typing import List, Tuple, Dict, Union
+from typing import List, Tuple, Union
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 
 
-def find_parent(parent: Dict[Union[int, str], Union[int, str]], vertex: Union[int, str]) -> Union[int, str]:
-    """Find the root parent of a vertex."""
+def find_parent(parent: List[int], vertex: int) -> int:
+    """Find the root parent of a vertex (by vertex index)."""
     while parent[vertex] != vertex:
         parent[vertex] = parent[parent[vertex]]
         vertex = parent[vertex]
     return vertex
 
 
-def union(parent: Dict[Union[int, str], Union[int, str]], rank: Dict[Union[int, str], int], vertex1: Union[int, str], vertex2: Union[int, str]) -> None:
-    """Merge two sets."""
+def union(parent: List[int], rank: List[int], vertex1: int, vertex2: int) -> None:
+    """Merge two sets (by vertex index)."""
     root1 = find_parent(parent, vertex1)
     root2 = find_parent(parent, vertex2)
 
@@ -25,6 +26,90 @@ def union(parent: Dict[Union[int, str], Union[int, str]], rank: Dict[Union[int,
         rank[root1] += 1
 
 
+def kruskal_core(edge_u: List[int], edge_v: List[int], order: List[int], n: int) -> List[int]:
+    """
+    Run Kruskal's main loop on integer vertex indices.
+
+    Args:
+        edge_u: First endpoint (vertex index) of each edge
+        edge_v: Second endpoint (vertex index) of each edge
+        order: Edge indices sorted by weight
+        n: Number of vertices
+
+    Returns:
+        Indices of the MST edges, in the order they were added
+    """
+    # We first need to declare a union-find structure to monitor inherent families and numbers of members in the family
+    parent = list(range(n))
+    rank = [0] * n
+
+    chosen = []
+    for i in order:
+        # For both vertices, we need to find their root parents
+        # Before we add two vertices, we need to check if they belong to the same family
+        # This way we avoid cycles, because adding an edge between two vertices in the same family creates a cycle
+        # (find_parent is inlined here, this loop runs once per edge)
+        root_u = edge_u[i]
+        while parent[root_u] != root_u:
+            parent[root_u] = parent[parent[root_u]]
+            root_u = parent[root_u]
+        root_v = edge_v[i]
+        while parent[root_v] != root_v:
+            parent[root_v] = parent[parent[root_v]]
+            root_v = parent[root_v]
+
+        if root_u != root_v:
+            chosen.append(i)
+            # Union check is to merge the two families (union by rank, also inlined)
+            if rank[root_u] < rank[root_v]:
+                parent[root_u] = root_v
+            elif rank[root_u] > rank[root_v]:
+                parent[root_v] = root_u
+            else:
+                parent[root_v] = root_u
+                rank[root_u] += 1
+
+            # MST complete when we have (n-1) edges
+            if len(chosen) == n - 1:
+                break
+
+    return chosen
+
+
+def weight_keys(edges: List[Tuple[Union[int, str], Union[int, str], float]]) -> np.ndarray:
+    """
+    Turn the edge weights into a NumPy array that orders the edges the same way the weights do.
+
+    Args:
+        edges: List of tuples (vertex1, vertex2, weight)
+
+    Returns:
+        The weights as float64 when that is exact, otherwise the rank of each weight
+        (equal weights get equal ranks)
+    """
+    weights = [edge[2] for edge in edges]
+
+    # Floats, and ints below 2**53, fit in a float64 exactly, so the array sorts just like the weights
+    # Bigger ints would be rounded, which can swap two edges that only differ in the last digits
+    if set(map(type, weights)) <= {int, float}:
+        try:
+            keys = np.array(weights, dtype=np.float64)
+        except OverflowError:
+            keys = None
+        if keys is not None and (not len(keys) or np.abs(keys).max() < 2 ** 53):
+            return keys
+
+    # Otherwise we sort the original weights in Python and number them by rank instead
+    order = sorted(range(len(weights)), key=weights.__getitem__)
+    ranks = [0] * len(weights)
+    rank = 0
+    for position, i in enumerate(order):
+        if position and weights[i] != weights[order[position - 1]]:
+            rank += 1
+        ranks[i] = rank
+    return np.array(ranks, dtype=np.int64)
+
+
 def kruskal_mst(edges: List[Tuple[Union[int, str], Union[int, str], float]],
                 vertices: List[Union[int, str]]) -> Tuple[List[Tuple[Union[int, str], Union[int, str], float]], float]:
     """
@@ -38,29 +123,105 @@ def kruskal_mst(edges: List[Tuple[Union[int, str], Union[int, str], float]],
         (mst_edges, total_weight)
     """
     # We first need to sort all the edges by weight so as to have a sorted weight list
-    sorted_edges = sorted(edges, key=lambda edge: edge[2])
+    # The weights go into a NumPy array so the sort runs in C without a Python key call per edge
+    # A stable sort keeps equal-weight edges in their input order
+    order = np.argsort(weight_keys(edges), kind='stable').tolist()
 
-    # We first need to declare a union-find structure to monitor inherent families and numbers of members in the family
-    parent = {v: v for v in vertices}
-    rank = {v: 0 for v in vertices}
+    # Vertices can be any label, so we number them once and run the main loop on plain integer lists
+    # This way every find is list indexing instead of hashing the vertex labels
+    vertex_index = {v: i for i, v in enumerate(vertices)}
+    edge_u = [vertex_index[edge[0]] for edge in edges]
+    edge_v = [vertex_index[edge[1]] for edge in edges]
 
     # Build MST
     mst_edges = []
     total_weight = 0
 
-    for u, v, weight in sorted_edges:
-        # For both vertices, we need to find their root parents
-        # Before we add two vertices, we need to check if they belong to the same family
-        # This way we avoid cycles, because adding an edge between two vertices in the same family creates a cycle
-        if find_parent(parent, u) != find_parent(parent, v):
-            mst_edges.append((u, v, weight))
-            total_weight += weight
-            # Union check is to merge the two families
-            union(parent, rank, u, v)
+    for i in kruskal_core(edge_u, edge_v, order, len(vertices)):
+        u, v, weight = edges[i]
+        mst_edges.append((u, v, weight))
+        total_weight += weight
 
-            # MST complete when we have (n-1) edges
-            if len(mst_edges) == len(vertices) - 1:
+    return mst_edges, total_weight
+
+
+def boruvka_mst(edges: List[Tuple[Union[int, str], Union[int, str], float]],
+                vertices: List[Union[int, str]]) -> Tuple[List[Tuple[Union[int, str], Union[int, str], float]], float]:
+    """
+    Find Minimum Spanning Tree using Boruvka's Algorithm.
+
+    Instead of one global sort of the edges, every round each component picks its
+    cheapest outgoing edge, and all of them are added at once. The per-component
+    minimum is a vectorized NumPy reduction over the edges, and there are at most
+    log2(V) rounds, so this pays off on large graphs where the sort in kruskal_mst
+    dominates. For small graphs kruskal_mst is the simpler choice.
+
+    Args:
+        edges: List of tuples (vertex1, vertex2, weight)
+        vertices: List of all vertices in the graph
+
+    Returns:
+        (mst_edges, total_weight)
+    """
+    n = len(vertices)
+    vertex_index = {v: i for i, v in enumerate(vertices)}
+
+    # Edges as parallel arrays: endpoints, weight and position in the input list
+    # (weight_keys orders the edges exactly like their weights, even when those don't fit a float64)
+    edge_u = np.fromiter((vertex_index[edge[0]] for edge in edges), dtype=np.int64, count=len(edges))
+    edge_v = np.fromiter((vertex_index[edge[1]] for edge in edges), dtype=np.int64, count=len(edges))
+    weights = weight_keys(edges)
+    edge_ids = np.arange(len(edges))
+    no_edge = len(edges)
+
+    parent = list(range(n))
+    rank = [0] * n
+
+    # Build MST
+    mst_edges = []
+    total_weight = 0
+
+    while len(mst_edges) < n - 1:
+        # Label every vertex with the root of its family
+        # Pointer jumping (component = component[component]) follows all parent chains at once
+        component = np.array(parent, dtype=np.int64)
+        while True:
+            grandparent = component[component]
+            if np.array_equal(grandparent, component):
                 break
+            component = grandparent
+        comp_u = component[edge_u]
+        comp_v = component[edge_v]
+
+        # Edges inside one family can never be used again, so we drop them for good
+        outgoing = comp_u != comp_v
+        if not outgoing.any():
+            break
+        edge_u, edge_v, weights, edge_ids = edge_u[outgoing], edge_v[outgoing], weights[outgoing], edge_ids[outgoing]
+        comp_u, comp_v = comp_u[outgoing], comp_v[outgoing]
+
+        # Cheapest outgoing weight of every family (an edge counts for both of its families)
+        min_weight = np.full(n, np.inf)
+        np.minimum.at(min_weight, comp_u, weights)
+        np.minimum.at(min_weight, comp_v, weights)
+
+        # Among edges at that weight, take the one that comes first in the input
+        # Breaking ties the same way everywhere is what keeps the chosen edges cycle-free
+        cheapest = np.full(n, no_edge)
+        at_min = weights == min_weight[comp_u]
+        np.minimum.at(cheapest, comp_u[at_min], edge_ids[at_min])
+        at_min = weights == min_weight[comp_v]
+        np.minimum.at(cheapest, comp_v[at_min], edge_ids[at_min])
+
+        # Two families can pick the same edge, so each edge is merged only once
+        for i in np.unique(cheapest[cheapest != no_edge]).tolist():
+            u, v, weight = edges[i]
+            root_u = find_parent(parent, vertex_index[u])
+            root_v = find_parent(parent, vertex_index[v])
+            if root_u != root_v:
+                mst_edges.append((u, v, weight))
+                total_weight += weight
+                union(parent, rank, root_u, root_v)
 
     return mst_edges, total_weight
 